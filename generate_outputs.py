@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Generate CSV and stats JSON files from wheels JSON data in a single pass
+"""
+import json
+import csv
+import os
+import pickle
+from collections import Counter
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+CSV_FIELDS = ('filename', 'source_type', 'source_info', 'version', 'python_tag', 'abi_tag', 'platform_tag', 'url', 'install_command', 'commit', 'release_tag', 'size', 'scraped_at')
+
+# Large write buffer so the many small CSV writes reach the OS in few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Install command pieces shared by every row
+_PIP_INSTALL = 'uv pip install '
+_PIP_SUFFIX = ' --torch-backend auto'
+_WHEELS_INDEX = 'https://wheels.vllm.ai/'
+
+# Maps source_type to its key in stats['source_counts']
+SOURCE_COUNT_KEYS = {
+    'commit': 'commits',
+    'github_release': 'github_releases',
+    'nightly': 'nightly',
+    'release_version': 'release_versions',
+}
+
+
+def classify_source(source_key: str):
+    """Return (source_type, source_info, install_command) for a results key.
+
+    GitHub release commands depend on each wheel URL, so ``None`` is returned
+    as the install command and callers build it per wheel.
+    """
+    if source_key.startswith('release_'):
+        return 'github_release', source_key.replace('release_', ''), None
+    elif source_key.startswith('version_'):
+        source_info = source_key.replace('version_', '')
+        return 'release_version', source_info, f'{_PIP_INSTALL}-U vllm=={source_info} --extra-index-url {_WHEELS_INDEX}{source_info}{_PIP_SUFFIX}'
+    elif source_key == 'nightly':
+        return 'nightly', 'nightly', f'{_PIP_INSTALL}vllm --extra-index-url {_WHEELS_INDEX}nightly{_PIP_SUFFIX}'
+    else:
+        # Regular commit
+        return 'commit', source_key, f'{_PIP_INSTALL}vllm --extra-index-url {_WHEELS_INDEX}{source_key}{_PIP_SUFFIX}'
+
+
+def load_wheels(path: str = 'data/wheels.json', cache: bool = False) -> dict:
+    """Read the scraped wheels JSON data.
+
+    With cache, the parsed data is cached as a pickle next to the JSON file
+    so that separate generator runs can skip re-parsing it. The cache is
+    ignored once the JSON file is newer than it.
+    """
+    if not cache:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read()) if orjson else json.load(f)
+
+    cache_path = os.path.splitext(path)[0] + '.pkl'
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Missing or unreadable cache, parse the JSON instead
+
+    data = load_wheels(path)
+
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # The cache is only an optimization
+
+    return data
+
+
+def write_stats(stats: dict, path: str = 'data/stats.json'):
+    """Write the stats JSON file"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if orjson:
+        payload = orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(stats, indent=2).encode('utf-8')
+    with open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(payload)
+
+    print(f'Generated stats: {stats["total_wheels"]} wheels from {stats["total_sources"]} sources')
+
+
+def generate_outputs(data: dict, csv_path: str = 'data/wheels.csv', stats_path: str = 'data/stats.json'):
+    """Stream CSV rows and build stats from one traversal of the scrape results.
+
+    Pass ``None`` for either path to skip writing that output.
+    """
+    results = data.get('results', {})
+    scraped_at = data.get('scrape_time', '')
+
+    stats = {
+        'last_updated': datetime.now().isoformat(),
+        'total_sources': len(results),
+        'total_files': 0,
+        'total_wheels': 0,
+        'source_counts': {
+            'commits': 0,
+            'github_releases': 0,
+            'nightly': 0,
+            'release_versions': 0
+        },
+        'python_versions': {},
+        'platforms': {}
+    }
+
+    # Histograms for stats['python_versions'] and stats['platforms']
+    py_counter = Counter()
+    plat_counter = Counter()
+
+    # Rows are written as they are built instead of being collected first
+    csv_file = writer = None
+    if csv_path:
+        os.makedirs(os.path.dirname(csv_path) or '.', exist_ok=True)
+        csv_file = open(csv_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_FIELDS)
+
+    try:
+        for source_key, files in results.items():
+            # Determine source type and metadata once per source
+            source_type, source_info, install_command = classify_source(source_key)
+            stats['source_counts'][SOURCE_COUNT_KEYS[source_type]] += 1
+
+            if not files:
+                continue
+            stats['total_files'] += len(files)
+
+            # Only GitHub release commands depend on the individual wheel URL
+            per_wheel_command = install_command is None
+
+            for file_info in files:
+                if file_info.get('type') != 'wheel':
+                    continue
+
+                # The scraper always sets these keys on wheel entries
+                python_tag = file_info['python_tag']
+                platform_tag = file_info['platform_tag']
+
+                stats['total_wheels'] += 1
+
+                # Count Python versions and platforms
+                py_counter[python_tag] += 1
+                plat_counter[platform_tag] += 1
+
+                if writer is None:
+                    continue
+
+                url = file_info['url']
+                if per_wheel_command:
+                    install_command = _PIP_INSTALL + url + _PIP_SUFFIX
+
+                # Row tuple in CSV_FIELDS order
+                writer.writerow((
+                    file_info['filename'],
+                    source_type,
+                    source_info,
+                    file_info['version'],
+                    python_tag,
+                    file_info['abi_tag'],
+                    platform_tag,
+                    url,
+                    install_command,
+                    file_info.get('commit', ''),
+                    file_info.get('release_tag', ''),
+                    file_info.get('size', ''),
+                    scraped_at
+                ))
+    finally:
+        if csv_file:
+            csv_file.close()
+
+    stats['python_versions'] = dict(py_counter)
+    stats['platforms'] = dict(plat_counter)
+
+    if csv_path:
+        print(f'Generated CSV with {stats["total_wheels"]} wheel entries')
+    if stats_path:
+        write_stats(stats, stats_path)
+
+    return stats
+
+
+def main():
+    generate_outputs(load_wheels())
+
+
+if __name__ == '__main__':
+    main()
@@ -5,61 +5,483 @@ Standalone script to scrape all vLLM wheels from https://wheels.vllm.ai/
 This script discovers all available packages and versions from the vLLM PyPI index.
 """
 
+import atexit
+import base64
+import gzip
+import http.client
+import os
+import random
 import re
+import sqlite3
 import sys
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
-from urllib.parse import urljoin, urlparse
-from urllib.request import urlopen, Request
-from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple, Any
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+import html
 import json
 import argparse
 from datetime import datetime
 import time
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
 
-class PyPIIndexParser(HTMLParser):
-    """Parser for PyPI simple index pages"""
+
+# Number of concurrent requests used when probing/scraping many URLs
+DEFAULT_MAX_WORKERS = 8
+
+USER_AGENT = 'vLLM-Wheel-Scraper/1.0'
+
+# Result keys are "release_<tag>", "version_<version>", "nightly" or a commit
+# hash; both prefixes are SOURCE_PREFIX_LENGTH characters long so a key can be
+# classified with a single slice
+SOURCE_PREFIX_LENGTH = 8
+
+# Results summary headers by result key prefix; other keys are commits
+SUMMARY_HEADERS = {'release_': 'GitHub Release: ', 'version_': 'Release Version: '}
+
+# Output chunks are collected up to this size before each write
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Compressed transfer encodings that can be decoded with the standard library
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# Retry policy for API requests hitting rate limits or server errors
+API_MAX_TRIES = 6
+API_MAX_BACKOFF = 60
+API_MAX_RETRY_WAIT = 300  # Give up rather than wait longer than this for a reset
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Index pages keyed by a commit hash never change once published
+IMMUTABLE_URL_PATTERN = re.compile(r'/[a-f0-9]{40}/')
+
+# Wheel filename format: {distribution}-{version}(-{build tag})?-{python tag}-{abi tag}-{platform tag}.whl
+WHEEL_FILENAME_PATTERN = re.compile(r'^(.+?)-(.+?)(?:-(.+?))?-(.+?)-(.+?)-(.+?)\.whl$')
+
+# 40 character hex string (commit hash), optionally with a trailing slash
+COMMIT_HASH_PATTERN = re.compile(r'^[a-f0-9]{40}/?$')
+
+# PEP 440 version: epoch, release, pre-release, post-release, dev-release, local
+VERSION_PATTERN = re.compile(
+    r'^v?(?:(\d+)!)?(\d+(?:\.\d+)*)'
+    r'(?:[-_.]?(a|b|c|rc|alpha|beta|pre|preview)[-_.]?(\d*))?'
+    r'(?:[-_.]?(?:post|rev|r)[-_.]?(\d*)|-(\d+))?'
+    r'(?:[-_.]?dev[-_.]?(\d*))?'
+    r'(?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?$',
+    re.IGNORECASE
+)
+PRE_RELEASE_ORDER = {'a': 0, 'alpha': 0, 'b': 1, 'beta': 1, 'c': 2, 'rc': 2, 'pre': 2, 'preview': 2}
+
+# Source distribution archive suffixes
+ARCHIVE_EXTENSIONS = ('.tar.gz', '.zip')
+FILE_EXTENSIONS = ('.whl',) + ARCHIVE_EXTENSIONS
+
+# href attribute of <a> tags on simple index pages, matched on the raw bytes
+HREF_PATTERN = re.compile(rb'<a\s[^>]*?href\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+
+
+def decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Decompress a response body according to its Content-Encoding"""
+    if not body or not content_encoding:
+        return body
+    content_encoding = content_encoding.strip().lower()
+    if content_encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if content_encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:  # Some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, reused per host within each thread.
+
+    Like urllib's default opener, HTTP_PROXY/HTTPS_PROXY/NO_PROXY are
+    honored: HTTPS is tunneled through the proxy with CONNECT, plain HTTP
+    requests are sent to the proxy with an absolute URL.
+    """
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._proxies = getproxies()
+
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Return (proxy netloc, proxy headers) for a host, or None to connect directly"""
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(urlsplit(f"//{netloc}").hostname or netloc):
+            return None
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+        parts = urlsplit(proxy)
+        headers = {}
+        if parts.username is not None:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+        return parts.netloc.rpartition('@')[2], headers
+
+    def _connections(self) -> Dict[Tuple[str, str], Tuple[http.client.HTTPConnection, Optional[Dict[str, str]]]]:
+        if not hasattr(self._local, 'connections'):
+            self._local.connections = {}
+        return self._local.connections
+
+    def _get_connection(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, Dict[str, str]]:
+        """Return a connection for a host and any headers its requests need"""
+        connections = self._connections()
+        entry = connections.get((scheme, netloc))
+        if entry is None:
+            conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            proxy = self._proxy_for(scheme, netloc)
+            if proxy is None:
+                entry = conn_class(netloc, timeout=self.timeout), None
+            else:
+                proxy_netloc, proxy_headers = proxy
+                conn = conn_class(proxy_netloc, timeout=self.timeout)
+                if scheme == 'https':
+                    conn.set_tunnel(netloc, headers=proxy_headers)
+                    entry = conn, None
+                else:
+                    entry = conn, proxy_headers
+            connections[(scheme, netloc)] = entry
+        return entry
+
+    def _discard(self, scheme: str, netloc: str):
+        entry = self._connections().pop((scheme, netloc), None)
+        if entry is not None:
+            entry[0].close()
+
+    def request(self, method: str, url: str, headers: Dict[str, str] = None):
+        """Send a single request, returning (status, reason, headers, body)"""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        request_headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+        if headers:
+            request_headers.update(headers)
+
+        for attempt in range(2):
+            conn, proxy_headers = self._get_connection(parts.scheme, parts.netloc)
+            try:
+                if proxy_headers is None:
+                    conn.request(method, path, headers=request_headers)
+                else:
+                    # Plain HTTP through a proxy: send the absolute URL
+                    conn.request(method, f"http://{parts.netloc}{path}",
+                                 headers={**request_headers, **proxy_headers})
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                self._discard(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+                continue  # The server may have closed an idle connection, retry once
+            if response.will_close:
+                self._discard(parts.scheme, parts.netloc)
+            body = decode_body(body, response.headers.get('Content-Encoding'))
+            return response.status, response.reason, response.headers, body
+
+
+class HTTPCache:
+    """On-disk cache of GET responses, revalidated with ETag/Last-Modified"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)'
+        )
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        with self._lock:
+            return self._db.execute(
+                'SELECT etag, last_modified, body FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+                (url, etag, last_modified, body)
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+_HTTP_POOL = ConnectionPool()
+_HTTP_CACHE: Optional[HTTPCache] = None
+
+
+def enable_http_cache(path: str):
+    """Cache GET responses in a SQLite file that persists across runs"""
+    global _HTTP_CACHE
+    _HTTP_CACHE = HTTPCache(path)
+    atexit.register(_HTTP_CACHE.close)
+
+
+def cached_get(url: str, headers: Dict[str, str] = None):
+    """GET a URL through the HTTP cache when it is enabled.
+
+    Commit-keyed URLs are served from the cache without revalidation, other
+    cached URLs are revalidated with If-None-Match/If-Modified-Since.
+    """
+    cached = _HTTP_CACHE.get(url) if _HTTP_CACHE else None
+    if cached is None:
+        status, response_headers, body = http_request('GET', url, headers)
+    else:
+        etag, last_modified, cached_body = cached
+        if IMMUTABLE_URL_PATTERN.search(url):
+            return 200, {}, cached_body
+
+        conditional_headers = dict(headers or {})
+        if etag:
+            conditional_headers['If-None-Match'] = etag
+        if last_modified:
+            conditional_headers['If-Modified-Since'] = last_modified
+        status, response_headers, body = http_request('GET', url, conditional_headers)
+        if status == 304:
+            return 200, response_headers, cached_body
+
+    if _HTTP_CACHE and status == 200:
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified or IMMUTABLE_URL_PATTERN.search(url):
+            _HTTP_CACHE.put(url, etag, last_modified, body)
+    return status, response_headers, body
+
+
+def http_request(method: str, url: str, headers: Dict[str, str] = None, max_redirects: int = 5):
+    """Request a URL over a pooled connection, following redirects.
+
+    Returns (status, headers, body); raises HTTPError for 4xx/5xx responses.
+    """
+    for _ in range(max_redirects + 1):
+        status, reason, response_headers, body = _HTTP_POOL.request(method, url, headers)
+        location = response_headers.get('Location')
+        if status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            continue
+        if status >= 400:
+            raise HTTPError(url, status, reason, response_headers, None)
+        return status, response_headers, body
+    raise HTTPError(url, status, 'Too many redirects', response_headers, None)
+
+
+def fetch_url(url: str) -> bytes:
+    """Fetch raw URL content with proper headers"""
+    try:
+        return cached_get(url)[2]
+    except Exception as e:
+        print(f"Error fetching {url}: {e}", file=sys.stderr)
+        return b""
+
+
+def head_ok(url: str) -> bool:
+    """Check that a URL exists with a HEAD request, without downloading it"""
+    if _HTTP_CACHE and _HTTP_CACHE.get(url):
+        return True
+    try:
+        return http_request('HEAD', url)[0] == 200
+    except HTTPError as e:
+        if e.code in (405, 501):  # Server does not support HEAD
+            return bool(fetch_url(url))
+        return False
+    except Exception:
+        return False
+
+
+def commit_index_exists(base_url: str, commit_hash: str) -> bool:
+    """Check whether the wheels server has an index for a commit"""
+    commit_url = urljoin(base_url, f"{commit_hash}/")
+    return head_ok(commit_url) or head_ok(urljoin(commit_url, "vllm/"))
+
+
+def parse_json(body: bytes) -> Any:
+    """Parse a JSON response body without decoding it to str first"""
+    return orjson.loads(body) if orjson else json.loads(body)
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize datetimes like orjson does when falling back to json"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json_line(obj: Any) -> bytes:
+    """Serialize obj as one compact NDJSON line"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':'), default=json_default).encode('utf-8') + b'\n'
+
+
+def extract_links(content: bytes) -> List[str]:
+    """Extract <a href> targets from a simple index page"""
+    links = []
+    for match in HREF_PATTERN.findall(content):
+        link = match.decode('utf-8', 'replace')
+        if '&' in link:
+            link = html.unescape(link)
+        links.append(link)
+    return links
+
+
+def github_headers() -> Dict[str, str]:
+    """Headers for GitHub API requests, authenticated when GITHUB_TOKEN is set"""
+    headers = {'Accept': 'application/vnd.github.v3+json'}
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    return headers
+
+
+def retry_delay(error: HTTPError, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed API request, None if not retryable"""
+    headers = error.headers or {}
+    retry_after = headers.get('Retry-After')
+    rate_limited = error.code == 429 or (error.code == 403 and (
+        retry_after is not None or headers.get('X-RateLimit-Remaining') == '0'))
+    if error.code not in RETRYABLE_STATUS_CODES and not rate_limited:
+        return None
     
-    def __init__(self):
-        super().__init__()
-        self.links = []
-        self.current_tag = None
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get('X-RateLimit-Reset')
+    if headers.get('X-RateLimit-Remaining') == '0' and reset and reset.isdigit():
+        return max(0.0, float(reset) - time.time()) + 1
+    return min(2 ** attempt + random.random(), API_MAX_BACKOFF)
+
+
+def get_with_retry(url: str, headers: Dict[str, str] = None, max_tries: int = API_MAX_TRIES) -> bytes:
+    """GET an API URL, backing off on rate limits (403/429) and 5xx responses"""
+    for attempt in range(max_tries):
+        try:
+            return cached_get(url, headers)[2]
+        except HTTPError as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt == max_tries - 1:
+                raise
+            if delay > API_MAX_RETRY_WAIT:
+                print(f"Rate limited by {urlsplit(url).netloc} for another {delay:.0f}s, "
+                      f"set GITHUB_TOKEN to raise the GitHub API limit", file=sys.stderr)
+                raise
+            print(f"HTTP {e.code} from {url}, retrying in {delay:.0f}s", file=sys.stderr)
+            time.sleep(delay)
+
+
+def classify_link(link: str) -> Optional[Tuple[str, str]]:
+    """Return (filename, kind) for a wheel or source archive link, else None.
+
+    kind is 'wheel' or 'source'; the filename is the last path segment of the
+    link with any query string and fragment removed.
+    """
+    end = len(link)
+    for sep in ('#', '?'):
+        index = link.find(sep, 0, end)
+        if index != -1:
+            end = index
     
-    def handle_starttag(self, tag, attrs):
-        if tag == 'a':
-            self.current_tag = tag
-            for attr_name, attr_value in attrs:
-                if attr_name == 'href':
-                    self.links.append(attr_value)
+    # Cheap suffix pre-check before slicing out the filename
+    path = link[:end]
+    if not path.endswith(FILE_EXTENSIONS):
+        return None
     
-    def handle_endtag(self, tag):
-        self.current_tag = None
+    filename = path[path.rfind('/') + 1:]
+    return filename, 'wheel' if filename.endswith('.whl') else 'source'
+
+
+def join_link(base_url: str, link: str) -> str:
+    """Resolve an index link against the page it was found on.
 
+    Most links are bare filenames relative to a directory page, which can be
+    appended directly; anything else goes through urljoin.
+    """
+    if (base_url.endswith('/') and ':' not in link and '/.' not in link
+            and not link.startswith(('/', '.', '?', '#'))):
+        return base_url + link
+    return urljoin(base_url, link)
 
-def fetch_url(url: str) -> str:
-    """Fetch URL content with proper headers"""
+
+def map_concurrently(func, items, max_workers: int = DEFAULT_MAX_WORKERS):
+    """Apply func to items in a thread pool, yielding results in input order"""
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        yield from executor.map(func, items)
+
+
+def map_as_completed(func, items, max_workers: int = DEFAULT_MAX_WORKERS):
+    """Apply func to items in a thread pool, yielding (index, result) pairs as
+    they finish. Pending work is cancelled if the caller stops early."""
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    futures = {executor.submit(func, item): index for index, item in enumerate(items)}
     try:
-        req = Request(url, headers={
-            'User-Agent': 'vLLM-Wheel-Scraper/1.0'
-        })
-        with urlopen(req) as response:
-            return response.read().decode('utf-8')
-    except Exception as e:
-        print(f"Error fetching {url}: {e}", file=sys.stderr)
-        return ""
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def version_sort_key(version: str) -> tuple:
+    """Sort key ordering versions per PEP 440, invalid versions sort first"""
+    match = VERSION_PATTERN.match(version.strip())
+    if not match:
+        return (0,)
+    epoch, release, pre_label, pre_num, post_num, post_implicit, dev_num = match.groups()
+    
+    release_parts = [int(part) for part in release.split('.')]
+    while len(release_parts) > 1 and release_parts[-1] == 0:
+        release_parts.pop()  # 1.0 and 1.0.0 are the same version
+    
+    is_post = post_num is not None or post_implicit is not None
+    if pre_label:
+        pre = (PRE_RELEASE_ORDER[pre_label.lower()], int(pre_num or 0))
+    elif dev_num is not None and not is_post:
+        pre = (-1, 0)  # 1.0.dev0 sorts before 1.0a0
+    else:
+        pre = (3, 0)  # Final releases sort after their pre-releases
+    post = int(post_num or post_implicit or 0) if is_post else -1
+    dev = int(dev_num or 0) if dev_num is not None else float('inf')
+    
+    return (1, int(epoch or 0), tuple(release_parts), pre, post, dev)
+
+
+@lru_cache(maxsize=8192)
+def match_wheel_filename(filename: str) -> Optional[Tuple[Optional[str], ...]]:
+    """Cached regex match of a wheel filename, returning its groups or None"""
+    match = WHEEL_FILENAME_PATTERN.match(filename)
+    return match.groups() if match else None
 
 
 def parse_wheel_filename(filename: str) -> Dict[str, str]:
-    """Parse wheel filename to extract metadata"""
-    # Wheel filename format: {distribution}-{version}(-{build tag})?-{python tag}-{abi tag}-{platform tag}.whl
-    wheel_pattern = r'^(.+?)-(.+?)(?:-(.+?))?-(.+?)-(.+?)-(.+?)\.whl$'
-    match = re.match(wheel_pattern, filename)
+    """Parse wheel filename to extract metadata.
+
+    The "type" key is always set, and wheel entries always carry the tag
+    keys, so consumers index them directly.
+    """
+    # The same filenames show up across many commits and versions, so the
+    # match is memoized; a fresh dict is still returned for callers to extend
+    groups = match_wheel_filename(filename)
     
-    if not match:
+    if groups is None:
         return {"filename": filename, "type": "unknown"}
     
-    name, version, build_tag, python_tag, abi_tag, platform_tag = match.groups()
+    name, version, build_tag, python_tag, abi_tag, platform_tag = groups
     
     return {
         "filename": filename,
@@ -80,12 +502,7 @@ def get_recent_commits_from_github(repo: str = "vllm-project/vllm", max_commits:
     api_url = f"https://api.github.com/repos/{repo}/commits?per_page={min(max_commits, 100)}"
     
     try:
-        req = Request(api_url, headers={
-            'User-Agent': 'vLLM-Wheel-Scraper/1.0',
-            'Accept': 'application/vnd.github.v3+json'
-        })
-        with urlopen(req) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        data = parse_json(get_with_retry(api_url, headers=github_headers()))
             
         commits = [commit['sha'] for commit in data]
         print(f"Found {len(commits)} recent commits from GitHub")
@@ -103,16 +520,11 @@ def get_pypi_versions(package_name: str = "vllm", max_versions: int = 50) -> Lis
     api_url = f"https://pypi.org/pypi/{package_name}/json"
     
     try:
-        req = Request(api_url, headers={
-            'User-Agent': 'vLLM-Wheel-Scraper/1.0'
-        })
-        with urlopen(req) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        data = parse_json(get_with_retry(api_url))
         
         versions = list(data['releases'].keys())
         # Sort versions in reverse order (newest first)
-        # This is a simple sort - for proper semantic version sorting we'd need a library
-        versions.sort(reverse=True)
+        versions.sort(key=version_sort_key, reverse=True)
         
         if max_versions and len(versions) > max_versions:
             versions = versions[:max_versions]
@@ -132,36 +544,30 @@ def get_github_releases(repo: str = "vllm-project/vllm", max_releases: int = 20)
     api_url = f"https://api.github.com/repos/{repo}/releases?per_page={min(max_releases, 100)}"
     
     try:
-        req = Request(api_url, headers={
-            'User-Agent': 'vLLM-Wheel-Scraper/1.0',
-            'Accept': 'application/vnd.github.v3+json'
-        })
-        with urlopen(req) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        data = parse_json(get_with_retry(api_url, headers=github_headers()))
             
         releases = []
         for release in data:
-            release_info = {
-                'tag_name': release['tag_name'],
-                'name': release['name'],
-                'published_at': release['published_at'],
-                'prerelease': release['prerelease'],
-                'assets': []
-            }
-            
             # Filter for wheel assets
-            for asset in release.get('assets', []):
-                if asset['name'].endswith('.whl'):
-                    asset_info = {
-                        'name': asset['name'],
-                        'download_url': asset['browser_download_url'],
-                        'size': asset['size'],
-                        'created_at': asset['created_at']
-                    }
-                    release_info['assets'].append(asset_info)
+            assets = [
+                {
+                    'name': asset['name'],
+                    'download_url': asset['browser_download_url'],
+                    'size': asset['size'],
+                    'created_at': asset['created_at']
+                }
+                for asset in release.get('assets', [])
+                if asset['name'].endswith('.whl')
+            ]
             
-            if release_info['assets']:  # Only include releases with wheel assets
-                releases.append(release_info)
+            if assets:  # Only include releases with wheel assets
+                releases.append({
+                    'tag_name': release['tag_name'],
+                    'name': release['name'],
+                    'published_at': release['published_at'],
+                    'prerelease': release['prerelease'],
+                    'assets': assets
+                })
         
         print(f"Found {len(releases)} releases with wheel assets from GitHub")
         return releases
@@ -171,7 +577,7 @@ def get_github_releases(repo: str = "vllm-project/vllm", max_releases: int = 20)
         return []
 
 
-def discover_commits(base_url: str) -> List[str]:
+def discover_commits(base_url: str, max_workers: int = DEFAULT_MAX_WORKERS) -> List[str]:
     """Discover all commit hashes from the wheels server"""
     print(f"Discovering commits from {base_url}")
     
@@ -181,15 +587,13 @@ def discover_commits(base_url: str) -> List[str]:
         print("Could not fetch root index", file=sys.stderr)
         return []
     
-    parser = PyPIIndexParser()
-    parser.feed(content)
+    links = extract_links(content)
     
     commits = []
-    commit_pattern = re.compile(r'^[a-f0-9]{40}/?$')  # 40 character hex string (commit hash)
     
-    for link in parser.links:
+    for link in links:
         clean_link = link.rstrip('/')
-        if commit_pattern.match(clean_link):
+        if COMMIT_HASH_PATTERN.match(clean_link):
             commits.append(clean_link)
     
     print(f"Found {len(commits)} commits from wheels server")
@@ -200,17 +604,15 @@ def discover_commits(base_url: str) -> List[str]:
         github_commits = get_recent_commits_from_github()
         
         # Test which GitHub commits have wheels available
+        candidates = github_commits[:50]  # Test first 50 commits
         available_commits = []
-        for commit in github_commits[:50]:  # Test first 50 commits
-            test_files = scrape_commit_files(base_url, commit)
-            if test_files:
+        results = map_concurrently(partial(commit_index_exists, base_url), candidates, max_workers)
+        for commit, available in zip(candidates, results):
+            if available:
                 available_commits.append(commit)
                 print(f"  Found wheels for commit {commit[:8]}")
             else:
                 print(f"  No wheels for commit {commit[:8]}")
-                
-            # Add a small delay to avoid overwhelming the server
-            time.sleep(0.1)
         
         # Combine and deduplicate
         all_commits = list(dict.fromkeys(commits + available_commits))
@@ -246,14 +648,13 @@ def discover_packages(base_url: str) -> List[str]:
         if not content:
             continue
             
-        parser = PyPIIndexParser()
-        parser.feed(content)
+        links = extract_links(content)
         
         # Filter for package links (not files)
         packages = []
-        for link in parser.links:
+        for link in links:
             # Skip if it's a file (ends with .whl, .tar.gz, etc.)
-            if any(link.endswith(ext) for ext in ['.whl', '.tar.gz', '.zip']):
+            if link.endswith(FILE_EXTENSIONS):
                 continue
                 
             # Clean up the package name
@@ -268,184 +669,122 @@ def discover_packages(base_url: str) -> List[str]:
     return list(all_packages)
 
 
-def scrape_commit_files(base_url: str, commit_hash: str) -> List[Dict[str, str]]:
-    """Scrape all files for a specific commit"""
-    
-    # Try both the direct commit URL and the commit/vllm/ subdirectory
-    possible_urls = [
-        urljoin(base_url, f"{commit_hash}/"),
-        urljoin(base_url, f"{commit_hash}/vllm/")
-    ]
+def scan_index(url: str, *, metadata: Dict[str, str], recurse: bool = True,
+               visited: Optional[Set[str]] = None, content: Optional[bytes] = None,
+               wheels_only: bool = False) -> List[Dict[str, Any]]:
+    """Collect wheel and source files listed on an index page.
+
+    metadata is added to every file entry. With recurse, subdirectory links
+    below url (like "vllm/") are scanned too; visited ensures every page is
+    fetched at most once. Pass content when the page was already fetched.
+    With wheels_only, source archives are skipped.
+    """
+    if visited is None:
+        visited = set()
+    if url in visited:
+        return []
+    visited.add(url)
     
-    all_files = []
+    if content is None:
+        content = fetch_url(url)
+    if not content:
+        return []
     
-    for commit_url in possible_urls:
-        content = fetch_url(commit_url)
-        if not content:
+    files = []
+    for link in extract_links(content):
+        # If this is a directory link (like "vllm/"), recursively check it
+        if link.endswith('/') or link == 'vllm':
+            if recurse:
+                subdir_url = join_link(url, link if link.endswith('/') else link + '/')
+                # Only descend below the current page, never to parents or
+                # siblings, and skip pages already scanned (e.g. "vllm" and
+                # "vllm/" both listed, or "vllm/../vllm/")
+                if subdir_url.startswith(url) and subdir_url not in visited:
+                    files.extend(scan_index(subdir_url, metadata=metadata, visited=visited,
+                                            wheels_only=wheels_only))
             continue
         
-        parser = PyPIIndexParser()
-        try:
-            parser.feed(content)
-        except Exception as e:
-            print(f"Error parsing HTML for commit {commit_hash[:8]} at {commit_url}: {e}", file=sys.stderr)
+        classified = classify_link(link)
+        if classified is None:
+            continue
+        filename, kind = classified
+        if wheels_only and kind != 'wheel':
             continue
         
-        files = []
-        for link in parser.links:
-            # Extract filename from link - handle various formats
-            filename = ""
-            if link.startswith('http'):
-                # Absolute URL
-                filename = Path(urlparse(link).path).name
-            else:
-                # Relative URL
-                filename = link.split('/')[-1].split('#')[0].split('?')[0]
-            
-            if not filename:
-                continue
-            
-            # Skip parent directory and current directory links
-            if filename in ['.', '..', '']:
-                continue
-            
-            # If this is a directory link (like "vllm/"), recursively check it
-            if filename.endswith('/') or (filename == 'vllm' and not filename.endswith('.whl')):
-                subdir_url = urljoin(commit_url, link)
-                if subdir_url not in possible_urls:  # Avoid infinite recursion
-                    subdir_files = scrape_commit_files_from_url(base_url, commit_hash, subdir_url)
-                    all_files.extend(subdir_files)
+        if kind == 'wheel':
+            file_info = parse_wheel_filename(filename)
+            if file_info['type'] != 'wheel':  # Only add if parsing succeeded
                 continue
-                
-            if filename.endswith('.whl'):
-                file_info = parse_wheel_filename(filename)
-                if file_info.get('type') == 'wheel':  # Only add if parsing succeeded
-                    file_info['url'] = urljoin(commit_url, link)
-                    file_info['commit'] = commit_hash
-                    files.append(file_info)
-            elif filename.endswith(('.tar.gz', '.zip')):
-                files.append({
-                    'filename': filename,
-                    'type': 'source',
-                    'url': urljoin(commit_url, link),
-                    'commit': commit_hash
-                })
-        
-        all_files.extend(files)
+        else:
+            file_info = {'filename': filename, 'type': 'source'}
+        file_info['url'] = join_link(url, link)
+        file_info.update(metadata)
+        files.append(file_info)
     
-    return all_files
+    return files
 
 
-def scrape_commit_files_from_url(base_url: str, commit_hash: str, url: str) -> List[Dict[str, str]]:
-    """Helper function to scrape files from a specific URL"""
+def scrape_commit_files(base_url: str, commit_hash: str, wheels_only: bool = False) -> List[Dict[str, str]]:
+    """Scrape all files for a specific commit"""
     
-    content = fetch_url(url)
-    if not content:
-        return []
+    # The commit page links to its vllm/ subdirectory, which is followed
+    # recursively, so the subdirectory only needs a direct probe when the
+    # commit page itself is missing
+    commit_url = urljoin(base_url, f"{commit_hash}/")
+    metadata = {'commit': commit_hash}
+    visited = set()
     
-    parser = PyPIIndexParser()
-    try:
-        parser.feed(content)
-    except Exception as e:
-        print(f"Error parsing HTML for commit {commit_hash[:8]} at {url}: {e}", file=sys.stderr)
-        return []
+    content = fetch_url(commit_url)
+    if content:
+        return scan_index(commit_url, metadata=metadata, visited=visited, content=content,
+                          wheels_only=wheels_only)
     
-    files = []
-    for link in parser.links:
-        # Extract filename from link - handle various formats
-        filename = ""
-        if link.startswith('http'):
-            # Absolute URL
-            filename = Path(urlparse(link).path).name
-        else:
-            # Relative URL
-            filename = link.split('/')[-1].split('#')[0].split('?')[0]
+    return scan_index(urljoin(commit_url, "vllm/"), metadata=metadata, visited=visited,
+                      wheels_only=wheels_only)
+
+
+def scrape_version_files(base_url: str, version: str, wheels_only: bool = False) -> List[Dict[str, str]]:
+    """Scrape files for a single release version, trying each path structure"""
+    
+    metadata = {'source': 'release_version', 'version_directory': version}
+    
+    # Try {version}/ before v{version}/, each with its vllm/ subdirectory
+    for prefix in (version, f"v{version}"):
+        version_url = urljoin(base_url, f"{prefix}/")
+        visited = set()
         
-        if not filename:
+        content = fetch_url(version_url)
+        if content:
+            # The listing was scanned for a vllm/ link already, so its vllm/
+            # subdirectory needs no separate probe
+            version_files = scan_index(version_url, metadata=metadata, visited=visited, content=content,
+                                       wheels_only=wheels_only)
+            if version_files:
+                return version_files
             continue
         
-        # Skip parent directory and current directory links
-        if filename in ['.', '..', '']:
-            continue
-            
-        if filename.endswith('.whl'):
-            file_info = parse_wheel_filename(filename)
-            if file_info.get('type') == 'wheel':  # Only add if parsing succeeded
-                file_info['url'] = urljoin(url, link)
-                file_info['commit'] = commit_hash
-                files.append(file_info)
-        elif filename.endswith(('.tar.gz', '.zip')):
-            files.append({
-                'filename': filename,
-                'type': 'source',
-                'url': urljoin(url, link),
-                'commit': commit_hash
-            })
+        version_files = scan_index(urljoin(version_url, "vllm/"), metadata=metadata, visited=visited,
+                                   wheels_only=wheels_only)
+        if version_files:
+            return version_files
     
-    return files
+    return []
 
 
-def scrape_release_version_wheels(base_url: str, versions: List[str]) -> Dict[str, List[Dict[str, str]]]:
+def scrape_release_version_wheels(base_url: str, versions: List[str],
+                                  max_workers: int = DEFAULT_MAX_WORKERS,
+                                  wheels_only: bool = False) -> Dict[str, List[Dict[str, str]]]:
     """Scrape wheels for specific release versions"""
     print(f"Scraping release version wheels for {len(versions)} versions...")
     
     all_version_files = {}
     
-    for version in versions:
+    # Probe all versions concurrently, reporting in order
+    results = map_concurrently(partial(scrape_version_files, base_url, wheels_only=wheels_only),
+                               versions, max_workers)
+    for version, version_files in zip(versions, results):
         print(f"  Checking version {version}...")
         
-        # Try different version path structures
-        version_paths = [
-            urljoin(base_url, f"{version}/"),
-            urljoin(base_url, f"{version}/vllm/"),
-            urljoin(base_url, f"v{version}/"),
-            urljoin(base_url, f"v{version}/vllm/"),
-        ]
-        
-        version_files = []
-        
-        for version_url in version_paths:
-            content = fetch_url(version_url)
-            if not content:
-                continue
-                
-            parser = PyPIIndexParser()
-            try:
-                parser.feed(content)
-            except Exception as e:
-                print(f"    Error parsing HTML for version {version} at {version_url}: {e}", file=sys.stderr)
-                continue
-            
-            for link in parser.links:
-                # Extract filename from link
-                filename = ""
-                if link.startswith('http'):
-                    filename = Path(urlparse(link).path).name
-                else:
-                    filename = link.split('/')[-1].split('#')[0].split('?')[0]
-                
-                if not filename or filename in ['.', '..', '']:
-                    continue
-                
-                if filename.endswith('.whl'):
-                    file_info = parse_wheel_filename(filename)
-                    if file_info.get('type') == 'wheel':
-                        file_info['url'] = urljoin(version_url, link)
-                        file_info['source'] = 'release_version'
-                        file_info['version_directory'] = version
-                        version_files.append(file_info)
-                elif filename.endswith(('.tar.gz', '.zip')):
-                    version_files.append({
-                        'filename': filename,
-                        'type': 'source',
-                        'url': urljoin(version_url, link),
-                        'source': 'release_version',
-                        'version_directory': version
-                    })
-            
-            if version_files:
-                break  # Found files in this path structure, no need to try others
-        
         if version_files:
             print(f"    Found {len(version_files)} files for version {version}")
             all_version_files[version] = version_files
@@ -455,7 +794,7 @@ def scrape_release_version_wheels(base_url: str, versions: List[str]) -> Dict[st
     return all_version_files
 
 
-def scrape_nightly_wheels(base_url: str) -> List[Dict[str, str]]:
+def scrape_nightly_wheels(base_url: str, wheels_only: bool = False) -> List[Dict[str, str]]:
     """Scrape nightly wheels"""
     print("Scraping nightly wheels...")
     
@@ -467,43 +806,8 @@ def scrape_nightly_wheels(base_url: str) -> List[Dict[str, str]]:
     ]
     
     for nightly_url in nightly_paths:
-        content = fetch_url(nightly_url)
-        if not content:
-            continue
-            
-        parser = PyPIIndexParser()
-        try:
-            parser.feed(content)
-        except Exception as e:
-            print(f"Error parsing HTML for nightly at {nightly_url}: {e}", file=sys.stderr)
-            continue
-        
-        files = []
-        for link in parser.links:
-            # Extract filename from link
-            filename = ""
-            if link.startswith('http'):
-                filename = Path(urlparse(link).path).name
-            else:
-                filename = link.split('/')[-1].split('#')[0].split('?')[0]
-            
-            if not filename or filename in ['.', '..', '']:
-                continue
-            
-            if filename.endswith('.whl'):
-                file_info = parse_wheel_filename(filename)
-                if file_info.get('type') == 'wheel':
-                    file_info['url'] = urljoin(nightly_url, link)
-                    file_info['source'] = 'nightly'
-                    files.append(file_info)
-            elif filename.endswith(('.tar.gz', '.zip')):
-                files.append({
-                    'filename': filename,
-                    'type': 'source',
-                    'url': urljoin(nightly_url, link),
-                    'source': 'nightly'
-                })
-        
+        files = scan_index(nightly_url, metadata={'source': 'nightly'}, recurse=False,
+                           wheels_only=wheels_only)
         if files:
             print(f"  Found {len(files)} nightly files")
             return files
@@ -512,7 +816,7 @@ def scrape_nightly_wheels(base_url: str) -> List[Dict[str, str]]:
     return []
 
 
-def scrape_package_files(base_url: str, package_name: str) -> List[Dict[str, str]]:
+def scrape_package_files(base_url: str, package_name: str, wheels_only: bool = False) -> List[Dict[str, str]]:
     """Scrape all files for a specific package (legacy method)"""
     
     # Try different index structures
@@ -525,31 +829,7 @@ def scrape_package_files(base_url: str, package_name: str) -> List[Dict[str, str
     ]
     
     for package_url in possible_urls:
-        content = fetch_url(package_url)
-        if not content:
-            continue
-            
-        parser = PyPIIndexParser()
-        parser.feed(content)
-        
-        files = []
-        for link in parser.links:
-            # Extract filename from link
-            filename = Path(urlparse(link).path).name
-            if not filename:
-                filename = link.split('/')[-1].split('#')[0]
-            
-            if filename.endswith('.whl'):
-                file_info = parse_wheel_filename(filename)
-                file_info['url'] = urljoin(package_url, link)
-                files.append(file_info)
-            elif filename.endswith(('.tar.gz', '.zip')):
-                files.append({
-                    'filename': filename,
-                    'type': 'source',
-                    'url': urljoin(package_url, link)
-                })
-        
+        files = scan_index(package_url, metadata={}, recurse=False, wheels_only=wheels_only)
         if files:
             print(f"  Found {len(files)} files for {package_name}")
             return files
@@ -557,6 +837,128 @@ def scrape_package_files(base_url: str, package_name: str) -> List[Dict[str, str
     return []
 
 
+def dump_json(obj: Any, compact: bool = False) -> bytes:
+    """Serialize obj as JSON, indented by two spaces unless compact"""
+    if orjson:
+        return orjson.dumps(obj, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, separators=(',', ':'), default=json_default).encode('utf-8')
+    return json.dumps(obj, indent=2, default=json_default).encode('utf-8')
+
+
+def write_all(fd: int, data: bytes):
+    """Write all of data to a file descriptor, looping over partial writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_json_output(path: str, envelope: Dict[str, Any], results: Dict[str, List[Dict[str, Any]]],
+                      compact: bool = False):
+    """Write envelope plus a "results" key to path as JSON.
+
+    Each source is serialized on its own, so the whole document is never
+    held in memory; the bytes match dumping it in one go. Per-source chunks
+    are small, so they are collected into a bytearray that is written to
+    the file descriptor once it reaches OUTPUT_BUFFER_SIZE, and once at the
+    end.
+    """
+    if compact:
+        head, open_results, key_sep = dump_json(envelope, True)[:-1], b',"results":{', b':'
+        first_sep, item_sep, close, close_empty = b'', b',', b'}}', b'}}'
+    else:
+        head, open_results, key_sep = dump_json(envelope)[:-2], b',\n  "results": {', b': '
+        first_sep, item_sep, close, close_empty = b'\n    ', b',\n    ', b'\n  }\n}', b'}\n}'
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        buffer = bytearray(head + open_results)  # The envelope reopened before its closing brace
+        separator = first_sep
+        for key, files in results.items():
+            value = dump_json(files, compact)
+            if not compact:
+                # Nest the source's own indentation two levels deeper
+                value = value.replace(b'\n', b'\n    ')
+            buffer += separator
+            buffer += dump_json(key, compact)
+            buffer += key_sep
+            buffer += value
+            separator = item_sep
+            if len(buffer) >= OUTPUT_BUFFER_SIZE:
+                write_all(fd, buffer)
+                buffer.clear()
+        buffer += close if results else close_empty
+        write_all(fd, buffer)
+    finally:
+        os.close(fd)
+
+
+class ResultsSummary:
+    """Source keys by type and file counts of the scrape results, from one pass"""
+
+    __slots__ = ('commit_keys', 'github_release_keys', 'version_keys', 'has_nightly',
+                 'total_files', 'wheel_files', 'wheels_by_source')
+
+    def __init__(self, results: Dict[str, List[Dict[str, Any]]]):
+        self.commit_keys = []
+        self.github_release_keys = []
+        self.version_keys = []
+        self.has_nightly = False
+        self.total_files = self.wheel_files = 0
+        self.wheels_by_source = {}  # Reused for the installation examples
+
+        for key, files in results.items():
+            wheels = [f for f in files if f['type'] == 'wheel']
+            self.wheels_by_source[key] = wheels
+            self.total_files += len(files)
+            self.wheel_files += len(wheels)
+
+            prefix = key[:SOURCE_PREFIX_LENGTH]
+            if key == 'nightly':
+                self.has_nightly = True
+            elif prefix == 'release_':
+                self.github_release_keys.append(key)
+            elif prefix == 'version_':
+                self.version_keys.append(key)
+            else:
+                self.commit_keys.append(key)
+
+    def source_counts(self) -> Dict[str, int]:
+        """Number of sources of each type, as saved in the output file"""
+        return {
+            'commits': len(self.commit_keys),
+            'github_releases': len(self.github_release_keys),
+            'nightly': 1 if self.has_nightly else 0,
+            'release_versions': len(self.version_keys)
+        }
+
+
+def format_file(file_info: Dict[str, Any], indent: str = '  ') -> str:
+    """Format a file entry as a line of the results summary"""
+    file_type = file_info['type']
+    if file_type == 'wheel':
+        return f"{indent}{file_info['filename']} ({file_info['python_tag']}-{file_info['abi_tag']}-{file_info['platform_tag']})"
+    return f"{indent}{file_info['filename']} ({file_type})"
+
+
+def format_files(files: List[Dict[str, Any]], indent: str = '  ', verbose: bool = False,
+                 show_size: bool = False) -> List[str]:
+    """Format file entries as results summary lines, with URLs when verbose"""
+    if not verbose:
+        return [format_file(file_info, indent) for file_info in files]
+    
+    # Verbose details are filled into one template, built once per call
+    details = f"{indent}  URL: {{url}}"
+    if show_size:
+        details += f"\n{indent}  Size: {{size}} bytes"
+    
+    lines = []
+    for file_info in files:
+        lines.append(format_file(file_info, indent))
+        lines.append(details.format(url=file_info.get('url', 'N/A'), size=file_info.get('size', 'N/A')))
+    return lines
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Scrape vLLM wheels from PyPI server and GitHub releases',
@@ -580,6 +982,9 @@ Examples:
   # Save results to JSON file
   python scrape_vllm_wheels.py --output wheels.json
   
+  # Stream results as one JSON line per source
+  python scrape_vllm_wheels.py --output wheels.ndjson --output-format ndjson
+  
   # Show only wheel files (no source distributions)
   python scrape_vllm_wheels.py --wheels-only
   
@@ -591,6 +996,11 @@ Examples:
     parser.add_argument('--base-url', default='https://wheels.vllm.ai/',
                         help='Base URL of the PyPI server')
     parser.add_argument('--output', '-o', help='Output file (JSON format)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write the JSON output without indentation (smaller and faster)')
+    parser.add_argument('--output-format', choices=['json', 'ndjson'], default='json',
+                        help='Output file format: one JSON document, or one JSON line per '
+                             'source written as it is scraped (default: json)')
     parser.add_argument('--commit', help='Scrape specific commit only')
     parser.add_argument('--github-releases', action='store_true',
                         help='Scrape GitHub releases for wheels')
@@ -614,6 +1024,10 @@ Examples:
                         help='Maximum number of versions to fetch from PyPI (default: 20)')
     parser.add_argument('--use-github', action='store_true',
                         help='Force use of GitHub API to discover commits')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Maximum number of concurrent requests (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--http-cache', metavar='FILE',
+                        help='SQLite file used to cache index pages across runs')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Verbose output')
     
@@ -621,8 +1035,41 @@ Examples:
     
     base_url = args.base_url.rstrip('/') + '/'
     
+    if args.http_cache:
+        enable_http_cache(args.http_cache)
+    
     all_results = {}
     
+    mode = 'legacy' if args.legacy_mode else 'multi-source'
+    if args.commit:
+        mode = 'single-commit'
+    elif args.github_releases and not args.all_sources:
+        mode = 'github-releases'
+    elif args.nightly and not args.all_sources:
+        mode = 'nightly'
+    
+    # With NDJSON output, a header line is written up front and every source
+    # is appended as soon as it has been scraped
+    ndjson_file = None
+    if args.output and args.output_format == 'ndjson':
+        ndjson_file = open(args.output, 'wb')
+        ndjson_file.write(dump_json_line({
+            'scrape_time': datetime.now(),
+            'base_url': base_url,
+            'mode': mode,
+        }))
+    
+    def stream_result(key: str, files: List[Dict[str, Any]]):
+        """Append a source to the NDJSON output, if any"""
+        if ndjson_file:
+            ndjson_file.write(dump_json_line({'key': key, 'files': files}))
+            ndjson_file.flush()
+    
+    def add_result(key: str, files: List[Dict[str, Any]]):
+        """Record the files found for a source"""
+        all_results[key] = files
+        stream_result(key, files)
+    
     # Determine which sources to scrape
     scrape_commits = True
     scrape_releases = args.github_releases or args.all_sources
@@ -642,13 +1089,10 @@ Examples:
         # Scrape files for each package
         for package in packages:
             print(f"\nScraping {package}...")
-            files = scrape_package_files(base_url, package)
-            
-            if args.wheels_only:
-                files = [f for f in files if f.get('type') == 'wheel']
+            files = scrape_package_files(base_url, package, args.wheels_only)
             
             if files:
-                all_results[package] = files
+                add_result(package, files)
                 
         scrape_commits = False  # Don't scrape commits in legacy mode
     
@@ -668,18 +1112,15 @@ Examples:
             release_files = []
             for asset in release['assets']:
                 file_info = parse_wheel_filename(asset['name'])
-                if file_info.get('type') == 'wheel':
+                if file_info['type'] == 'wheel':
                     file_info['url'] = asset['download_url']
                     file_info['source'] = 'github_release'
                     file_info['release_tag'] = release['tag_name']
                     file_info['size'] = asset['size']
                     release_files.append(file_info)
             
-            if args.wheels_only:
-                release_files = [f for f in release_files if f.get('type') == 'wheel']
-            
             if release_files:
-                all_results[f"release_{release['tag_name']}"] = release_files
+                add_result(f"release_{release['tag_name']}", release_files)
                 print(f"  Found {len(release_files)} wheel files")
     
     # Scrape nightly wheels
@@ -688,13 +1129,10 @@ Examples:
         print("SCRAPING NIGHTLY WHEELS")
         print("="*50)
         
-        nightly_files = scrape_nightly_wheels(base_url)
-        
-        if args.wheels_only:
-            nightly_files = [f for f in nightly_files if f.get('type') == 'wheel']
+        nightly_files = scrape_nightly_wheels(base_url, args.wheels_only)
         
         if nightly_files:
-            all_results['nightly'] = nightly_files
+            add_result('nightly', nightly_files)
     
     # Scrape release version wheels
     if scrape_release_versions:
@@ -706,14 +1144,12 @@ Examples:
         versions = get_pypi_versions(max_versions=args.max_versions)
         
         if versions:
-            version_files_dict = scrape_release_version_wheels(base_url, versions)
+            version_files_dict = scrape_release_version_wheels(base_url, versions, args.max_workers,
+                                                               args.wheels_only)
             
             for version, files in version_files_dict.items():
-                if args.wheels_only:
-                    files = [f for f in files if f.get('type') == 'wheel']
-                
                 if files:
-                    all_results[f"version_{version}"] = files
+                    add_result(f"version_{version}", files)
     
     # Scrape commits
     if scrape_commits and not (args.github_releases or args.nightly) or args.all_sources:
@@ -731,17 +1167,16 @@ Examples:
                 # Filter to only commits that have wheels
                 print("Testing commits for wheel availability...")
                 available_commits = []
-                for commit in commits:
-                    test_files = scrape_commit_files(base_url, commit)
-                    if test_files:
+                results = map_concurrently(partial(commit_index_exists, base_url), commits, args.max_workers)
+                for commit, available in zip(commits, results):
+                    if available:
                         available_commits.append(commit)
                         print(f"  ✓ Found wheels for commit {commit[:8]}")
                     else:
                         print(f"  ✗ No wheels for commit {commit[:8]}")
-                    time.sleep(0.1)
                 commits = available_commits
             else:
-                commits = discover_commits(base_url)
+                commits = discover_commits(base_url, args.max_workers)
                 if args.max_commits and len(commits) > args.max_commits:
                     print(f"Limiting to {args.max_commits} most recent commits")
                     commits = commits[:args.max_commits]
@@ -751,17 +1186,29 @@ Examples:
         else:
             print(f"\nFound {len(commits)} commits to check")
             
-            # Scrape files for each commit
-            for i, commit in enumerate(commits, 1):
-                print(f"\nScraping commit {i}/{len(commits)}: {commit[:8]}...")
-                files = scrape_commit_files(base_url, commit)
-                
-                if args.wheels_only:
-                    files = [f for f in files if f.get('type') == 'wheel']
-                
+            # Scrape files for each commit concurrently, reporting each one as
+            # it finishes; results keep the commit order, and on Ctrl-C the
+            # commits scraped so far are kept
+            commit_files = [None] * len(commits)
+            done = 0
+            try:
+                results = map_as_completed(partial(scrape_commit_files, base_url, wheels_only=args.wheels_only),
+                                           commits, args.max_workers)
+                for index, files in results:
+                    done += 1
+                    commit = commits[index]
+                    print(f"\nScraped commit {done}/{len(commits)}: {commit[:8]}")
+                    
+                    if files:
+                        commit_files[index] = files
+                        stream_result(commit, files)
+                        print(f"  Found {len(files)} files for commit {commit[:8]}")
+            except KeyboardInterrupt:
+                print(f"\nInterrupted, keeping the {done} commits scraped so far", file=sys.stderr)
+            
+            for commit, files in zip(commits, commit_files):
                 if files:
                     all_results[commit] = files
-                    print(f"  Found {len(files)} files for commit {commit[:8]}")
     
     # Display results
     print("\n" + "="*50)
@@ -770,7 +1217,7 @@ Examples:
     
     for key, files in all_results.items():
         if args.legacy_mode:
-            print(f"\nPackage: {key}")
+            lines = [f"\nPackage: {key}"]
             # Group by version for display
             versions = {}
             for file_info in files:
@@ -779,166 +1226,103 @@ Examples:
                     versions[version] = []
                 versions[version].append(file_info)
             
-            # Sort versions (rough sort)
-            sorted_versions = sorted(versions.keys(), reverse=True)
+            # Sort versions (newest first)
+            sorted_versions = sorted(versions.keys(), key=version_sort_key, reverse=True)
             
             if args.latest_only and sorted_versions:
                 sorted_versions = [sorted_versions[0]]
             
             for version in sorted_versions:
-                print(f"  Version {version}:")
-                for file_info in versions[version]:
-                    if file_info.get('type') == 'wheel':
-                        print(f"    {file_info['filename']} ({file_info.get('python_tag', 'unknown')}-{file_info.get('abi_tag', 'unknown')}-{file_info.get('platform_tag', 'unknown')})")
-                    else:
-                        print(f"    {file_info['filename']} ({file_info.get('type', 'unknown')})")
-                    
-                    if args.verbose:
-                        print(f"      URL: {file_info.get('url', 'N/A')}")
-        elif key.startswith('release_'):
-            release_tag = key.replace('release_', '')
-            print(f"\nGitHub Release: {release_tag}")
-            for file_info in files:
-                if file_info.get('type') == 'wheel':
-                    print(f"  {file_info['filename']} ({file_info.get('python_tag', 'unknown')}-{file_info.get('abi_tag', 'unknown')}-{file_info.get('platform_tag', 'unknown')})")
-                else:
-                    print(f"  {file_info['filename']} ({file_info.get('type', 'unknown')})")
-                
-                if args.verbose:
-                    print(f"    URL: {file_info.get('url', 'N/A')}")
-                    print(f"    Size: {file_info.get('size', 'N/A')} bytes")
-        elif key == 'nightly':
-            print(f"\nNightly Wheels:")
-            for file_info in files:
-                if file_info.get('type') == 'wheel':
-                    print(f"  {file_info['filename']} ({file_info.get('python_tag', 'unknown')}-{file_info.get('abi_tag', 'unknown')}-{file_info.get('platform_tag', 'unknown')})")
-                else:
-                    print(f"  {file_info['filename']} ({file_info.get('type', 'unknown')})")
-                
-                if args.verbose:
-                    print(f"    URL: {file_info.get('url', 'N/A')}")
-        elif key.startswith('version_'):
-            version = key.replace('version_', '')
-            print(f"\nRelease Version: {version}")
-            for file_info in files:
-                if file_info.get('type') == 'wheel':
-                    print(f"  {file_info['filename']} ({file_info.get('python_tag', 'unknown')}-{file_info.get('abi_tag', 'unknown')}-{file_info.get('platform_tag', 'unknown')})")
-                else:
-                    print(f"  {file_info['filename']} ({file_info.get('type', 'unknown')})")
-                
-                if args.verbose:
-                    print(f"    URL: {file_info.get('url', 'N/A')}")
+                lines.append(f"  Version {version}:")
+                lines.extend(format_files(versions[version], '    ', args.verbose))
         else:
-            print(f"\nCommit: {key}")
-            for file_info in files:
-                if file_info.get('type') == 'wheel':
-                    print(f"  {file_info['filename']} ({file_info.get('python_tag', 'unknown')}-{file_info.get('abi_tag', 'unknown')}-{file_info.get('platform_tag', 'unknown')})")
-                else:
-                    print(f"  {file_info['filename']} ({file_info.get('type', 'unknown')})")
-                
-                if args.verbose:
-                    print(f"    URL: {file_info.get('url', 'N/A')}")
-    
-    # Summary
-    total_files = sum(len(files) for files in all_results.values())
-    wheel_files = sum(len([f for f in files if f.get('type') == 'wheel']) 
-                      for files in all_results.values())
+            prefix = key[:SOURCE_PREFIX_LENGTH]
+            if key == 'nightly':
+                header = "Nightly Wheels:"
+            elif prefix in SUMMARY_HEADERS:
+                header = SUMMARY_HEADERS[prefix] + key[SOURCE_PREFIX_LENGTH:]
+            else:
+                header = f"Commit: {key}"
+            
+            # Only GitHub release assets carry a size
+            lines = [f"\n{header}"]
+            lines.extend(format_files(files, verbose=args.verbose, show_size=prefix == 'release_'))
+        
+        # One write per source instead of one per line
+        print('\n'.join(lines))
     
-    # Count different source types
-    commit_count = len([k for k in all_results.keys() if not k.startswith('release_') and k != 'nightly' and not k.startswith('version_')])
-    github_release_count = len([k for k in all_results.keys() if k.startswith('release_')])
-    nightly_count = 1 if 'nightly' in all_results else 0
-    version_count = len([k for k in all_results.keys() if k.startswith('version_')])
+    summary = ResultsSummary(all_results)
     
     # Save results
     if args.output:
-        mode = 'legacy' if args.legacy_mode else 'multi-source'
-        if args.commit:
-            mode = 'single-commit'
-        elif args.github_releases and not args.all_sources:
-            mode = 'github-releases'
-        elif args.nightly and not args.all_sources:
-            mode = 'nightly'
-        
-        output_data = {
-            'scrape_time': datetime.now().isoformat(),
-            'base_url': base_url,
-            'mode': mode,
-            'sources': {
-                'commits': commit_count,
-                'github_releases': github_release_count,
-                'nightly': nightly_count,
-                'release_versions': version_count
-            },
-            'results': all_results
-        }
+        sources = summary.source_counts()
         
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        if ndjson_file:
+            # The results were streamed already, finish with the source counts
+            ndjson_file.write(dump_json_line({'sources': sources}))
+            ndjson_file.close()
+        else:
+            envelope = {
+                'scrape_time': datetime.now(),
+                'base_url': base_url,
+                'mode': mode,
+                'sources': sources,
+            }
+            write_json_output(args.output, envelope, all_results, args.compact)
         
         print(f"\nResults saved to {args.output}")
     
-    print(f"\nSummary:")
+    # Collect the summary and examples and write them out at once
+    out = ["\nSummary:"]
     
     if args.legacy_mode:
-        print(f"  Packages: {len(all_results)}")
+        out.append(f"  Packages: {len(all_results)}")
     else:
-        if commit_count > 0:
-            print(f"  Commits: {commit_count}")
-        if github_release_count > 0:
-            print(f"  GitHub Releases: {github_release_count}")
-        if nightly_count > 0:
-            print(f"  Nightly Wheels: {nightly_count}")
-        if version_count > 0:
-            print(f"  Release Versions: {version_count}")
-    
-    print(f"  Total files: {total_files}")
-    print(f"  Wheel files: {wheel_files}")
-    print(f"  Source files: {total_files - wheel_files}")
+        if summary.commit_keys:
+            out.append(f"  Commits: {len(summary.commit_keys)}")
+        if summary.github_release_keys:
+            out.append(f"  GitHub Releases: {len(summary.github_release_keys)}")
+        if summary.has_nightly:
+            out.append("  Nightly Wheels: 1")
+        if summary.version_keys:
+            out.append(f"  Release Versions: {len(summary.version_keys)}")
+    
+    out.append(f"  Total files: {summary.total_files}")
+    out.append(f"  Wheel files: {summary.wheel_files}")
+    out.append(f"  Source files: {summary.total_files - summary.wheel_files}")
     
     # Installation examples
-    if wheel_files > 0:
-        print(f"\nInstallation Examples:")
+    wheels_by_source = summary.wheels_by_source
+    if summary.wheel_files > 0:
+        out.append("\nInstallation Examples:")
         
         # Example from nightly
-        if 'nightly' in all_results:
-            nightly_wheels = [f for f in all_results['nightly'] if f.get('type') == 'wheel']
-            if nightly_wheels:
-                print(f"  # Install nightly wheel:")
-                print(f"  uv pip install vllm --extra-index-url https://wheels.vllm.ai/nightly --torch-backend auto")
+        if summary.has_nightly and wheels_by_source['nightly']:
+            out.append("  # Install nightly wheel:")
+            out.append("  uv pip install vllm --extra-index-url https://wheels.vllm.ai/nightly --torch-backend auto")
         
         # Example from GitHub releases
-        github_release_keys = [k for k in all_results.keys() if k.startswith('release_')]
-        if github_release_keys:
-            release_key = github_release_keys[0]
-            release_wheels = [f for f in all_results[release_key] if f.get('type') == 'wheel']
-            if release_wheels:
-                example_wheel = release_wheels[0]
-                release_tag = release_key.replace('release_', '')
-                print(f"  # Install GitHub release wheel ({release_tag}):")
-                print(f"  uv pip install {example_wheel['url']}")
+        if summary.github_release_keys and wheels_by_source[summary.github_release_keys[0]]:
+            release_key = summary.github_release_keys[0]
+            example_wheel = wheels_by_source[release_key][0]
+            release_tag = release_key.replace('release_', '')
+            out.append(f"  # Install GitHub release wheel ({release_tag}):")
+            out.append(f"  uv pip install {example_wheel['url']}")
         
         # Example from release versions
-        version_keys = [k for k in all_results.keys() if k.startswith('version_')]
-        if version_keys:
-            version_key = version_keys[0]
-            version_wheels = [f for f in all_results[version_key] if f.get('type') == 'wheel']
-            if version_wheels:
-                example_wheel = version_wheels[0]
-                version = version_key.replace('version_', '')
-                print(f"  # Install release version wheel ({version}):")
-                print(f"  uv pip install -U vllm=={version} --extra-index-url https://wheels.vllm.ai/{version} --torch-backend auto")
+        if summary.version_keys and wheels_by_source[summary.version_keys[0]]:
+            version = summary.version_keys[0].replace('version_', '')
+            out.append(f"  # Install release version wheel ({version}):")
+            out.append(f"  uv pip install -U vllm=={version} --extra-index-url https://wheels.vllm.ai/{version} --torch-backend auto")
         
         # Example from commits
-        commit_keys = [k for k in all_results.keys() if not k.startswith('release_') and k != 'nightly' and not k.startswith('version_')]
-        if commit_keys:
-            commit_key = commit_keys[0]
-            commit_wheels = [f for f in all_results[commit_key] if f.get('type') == 'wheel']
-            if commit_wheels:
-                example_wheel = commit_wheels[0]
-                print(f"  # Install commit wheel ({commit_key[:8]}):")
-                print(f"  export VLLM_COMMIT={commit_key}")
-                print(f"  uv pip install vllm --extra-index-url https://wheels.vllm.ai/${{VLLM_COMMIT}} --torch-backend auto")
+        if summary.commit_keys and wheels_by_source[summary.commit_keys[0]]:
+            commit_key = summary.commit_keys[0]
+            out.append(f"  # Install commit wheel ({commit_key[:8]}):")
+            out.append(f"  export VLLM_COMMIT={commit_key}")
+            out.append(f"  uv pip install vllm --extra-index-url https://wheels.vllm.ai/${{VLLM_COMMIT}} --torch-backend auto")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":